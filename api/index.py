@@ -2,18 +2,33 @@
 """
 Vercel MCP Server
 """
-import json
+import asyncio
 import logging
 import os
-import tempfile
-import traceback
-
-import gdown
+import re
+import time
 
 import httpx
-from dotenv import load_dotenv
-from pydantic import BaseModel, Field
-from typing_extensions import Dict, List, Optional, Union
+import orjson
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Discriminator,
+    Field,
+    Tag,
+    ValidationError,
+)
+from pydantic_core import to_json
+from typing_extensions import (
+    Annotated,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Union,
+)
 
 
 # Configure logging
@@ -21,8 +36,14 @@ logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 
-load_dotenv()
+# Vercel injects the environment itself, so only look for a .env file elsewhere
+if os.environ.get("VERCEL") != "1":
+    from dotenv import load_dotenv
+
+    load_dotenv()
 BASE_API_URL = os.getenv("BASE_API_URL")
+# Validate HireStream responses instead of trusting them (useful in development)
+STRICT_VALIDATION = os.getenv("STRICT") == "1"
 
 
 # ------------------------------
@@ -31,6 +52,8 @@ BASE_API_URL = os.getenv("BASE_API_URL")
 
 
 class Job(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
     id: int
     uuid: str = Field(
         description="The UUID of the job. This UUID can be used further to get details about the job."
@@ -44,12 +67,16 @@ class Job(BaseModel):
 
 
 class Department(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
     title: str
     id: int
     job_count: int
 
 
 class JobListingResponse(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
     count: int
     next: Optional[str] = None
     previous: Optional[str] = None
@@ -62,13 +89,45 @@ class JobDetailsRequest(BaseModel):
 
 
 class JobDetailsResponse(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
     job: Job
     departments: List[Department]
 
 
+# HireStream is trusted, so these skip validation and only build the models.
+# Never do this for user-supplied input such as JobApplyRequest.
+def _construct_job_listing(data: Dict[str, Any]) -> JobListingResponse:
+    return JobListingResponse.model_construct(
+        **{
+            **data,
+            "results": [Job.model_construct(**job) for job in data.get("results", [])],
+            "departments": [
+                Department.model_construct(**department)
+                for department in data.get("departments", [])
+            ],
+        }
+    )
+
+
+def _construct_job_details(data: Dict[str, Any]) -> JobDetailsResponse:
+    return JobDetailsResponse.model_construct(
+        **{
+            **data,
+            "job": Job.model_construct(**data["job"]),
+            "departments": [
+                Department.model_construct(**department)
+                for department in data.get("departments", [])
+            ],
+        }
+    )
+
+
 class Skill(BaseModel):
-    id: int
-    title: str
+    """Represents a skill possessed by a candidate"""
+
+    id: int = Field(description="Unique identifier for the skill")
+    title: str = Field(description="Name of the skill")
 
 
 class Education(BaseModel):
@@ -105,18 +164,6 @@ class ResumeData(BaseModel):
     cv_parsed_by: Optional[str] = None
 
 
-from typing import List, Optional
-
-from pydantic import BaseModel, Field
-
-
-class Skill(BaseModel):
-    """Represents a skill possessed by a candidate"""
-
-    id: int = Field(description="Unique identifier for the skill")
-    title: str = Field(description="Name of the skill")
-
-
 class Candidate(BaseModel):
     """Represents a job candidate's personal and professional information"""
 
@@ -192,12 +239,41 @@ class OptionRequirement(BaseModel):
     selected_option: int = Field(..., description="Selected option ID")
 
 
-RequirementValue = Union[
-    EmploymentRequirement,
-    EducationRequirement,
-    NumericRequirement,
-    URLRequirement,
-    OptionRequirement,
+# Field that only one requirement type has, mapped to that type's tag
+_REQUIREMENT_TAG_FIELDS = (
+    ("employer", "employment"),
+    ("school", "education"),
+    ("value", "numeric"),
+    ("url", "url"),
+    ("selected_option", "option"),
+)
+
+
+def _requirement_tag(value) -> Optional[str]:
+    """Pick the RequirementValue branch from its distinguishing field, so
+    pydantic validates one schema per item instead of trying every branch"""
+    if isinstance(value, dict):
+        fields = value
+    elif isinstance(value, BaseModel):
+        fields = type(value).model_fields
+    else:
+        # Let pydantic report the item as invalid
+        return None
+    for field, tag in _REQUIREMENT_TAG_FIELDS:
+        if field in fields:
+            return tag
+    return None
+
+
+RequirementValue = Annotated[
+    Union[
+        Annotated[EmploymentRequirement, Tag("employment")],
+        Annotated[EducationRequirement, Tag("education")],
+        Annotated[NumericRequirement, Tag("numeric")],
+        Annotated[URLRequirement, Tag("url")],
+        Annotated[OptionRequirement, Tag("option")],
+    ],
+    Discriminator(_requirement_tag),
 ]
 
 
@@ -256,39 +332,84 @@ class ResumeParseRequest(BaseModel):
 # ------------------------------
 
 
+# File id in Drive share links (.../file/d/<id>/view or ...?id=<id>)
+_DRIVE_ID_RE = re.compile(r"/d/([A-Za-z0-9_-]{20,})|[?&]id=([A-Za-z0-9_-]{20,})")
+
+# Staged timeouts so a dead upstream fails fast on connect instead of
+# holding the tool call for the whole budget
+DEFAULT_TIMEOUT = httpx.Timeout(connect=2.0, read=15.0, write=10.0, pool=2.0)
+UPLOAD_TIMEOUT = httpx.Timeout(connect=2.0, read=30.0, write=60.0, pool=2.0)
+
+
 class HireStreamAPIClient:
+    _JSON_HEADERS = {
+        "Content-Type": "application/json",
+        # "Authorization": f"Bearer {self.access_token}",         # Authentication not needed for hirestream
+    }
+
     def __init__(
         self,
         access_token: str,
         base_api_url: str = "https://cogent-labs.hirestream.io/api/v1",
         logger=None,
+        timeout: httpx.Timeout = DEFAULT_TIMEOUT,
+        upload_timeout: httpx.Timeout = UPLOAD_TIMEOUT,
+        jobs_cache_ttl: float = 30.0,
     ):
         self.base_api_url = base_api_url
         self.access_token = access_token
+        self.upload_timeout = upload_timeout
+        self.jobs_cache_ttl = jobs_cache_ttl
+        # (fetched_at, response) of the last successful list_jobs call
+        self._jobs_cache: Optional[tuple[float, JobListingResponse]] = None
+        self._jobs_lock = asyncio.Lock()
+        # In-flight GETs by endpoint, shared by concurrent identical calls
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Response models already checked against a live response (see _build)
+        self._validated_models: set[type[BaseModel]] = set()
         self.logger = logger or logging.getLogger(__name__)
+        # Shared client so keep-alive connections are reused across tool calls
+        self._client = httpx.AsyncClient(
+            base_url=base_api_url,
+            # Multiplex concurrent tool calls over one connection; httpx falls
+            # back to HTTP/1.1 when the server doesn't negotiate h2
+            http2=True,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=40,
+                keepalive_expiry=30.0,
+            ),
+        )
         self.logger.info(
             f"Initialized HireStreamAPIClient with base URL: {base_api_url}"
         )
 
-    async def _api_call(self, method: str, endpoint: str, payload: str = None) -> dict:
+    async def _api_call(
+        self, method: str, endpoint: str, payload: Union[dict, bytes, None] = None
+    ) -> dict:
         """Utility function for API calls to the wallet.
         It sets common headers and raises errors on non-2xx responses.
+        Pre-encoded ``bytes`` payloads are sent as-is.
         """
         url = f"{self.base_api_url}/{endpoint}"
-        payload = json.dumps(payload)
+        if payload is not None and not isinstance(payload, bytes):
+            payload = orjson.dumps(payload)
         self.logger.info(f"Making {method} request to {url}")
-        self.logger.debug(f"Request payload: {payload}")
+        # Lazy %-args: don't format the whole payload unless debug is on
+        self.logger.debug("Request payload: %s", payload)
 
-        headers = {
-            "Content-Type": "application/json",
-            # "Authorization": f"Bearer {self.access_token}",         # Authentication not needed for hirestream
-        }
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                response = await client.request(
-                    method, url, headers=headers, data=payload, follow_redirects=False
-                )
-
+            response = await self._client.request(
+                method,
+                endpoint,
+                headers=self._JSON_HEADERS,
+                content=payload,
+                follow_redirects=False,
+            )
+
+            # response.text decodes the full body, only build it when needed
+            if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(
                     f"Response status: {response.status_code} Response: {response.text}"
                 )
@@ -296,21 +417,86 @@ class HireStreamAPIClient:
                 self.logger.error(f"API Error {response.status_code}: {response.text}")
                 raise Exception(f"API Error {response.status_code}: {response.text}")
             try:
-                return response.json()
+                return orjson.loads(response.content)
             except Exception:
                 self.logger.error(f"JSON Parsing Error: {response.text}")
                 return {"text": response.text}
         except Exception as e:
-            self.logger.error(f"Request failed: {str(e)}")
-            traceback.print_exc()
+            self.logger.exception("Request failed")
             return {"text": str(e)}
 
+    async def _singleflight(
+        self, key: str, coro_fn: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Run coro_fn once per key at a time; concurrent callers share the result"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(coro_fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # A cancelled caller must not cancel the call the others are waiting on
+        return await asyncio.shield(task)
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections"""
+        await self._client.aclose()
+
     async def list_jobs(self) -> JobListingResponse:
-        """List all jobs"""
+        """List all jobs, served from a short-lived in-process cache"""
+        if self._jobs_cache_is_fresh():
+            return self._jobs_cache[1]
+
+        # Only one caller refreshes; the rest wait and reuse its result
+        async with self._jobs_lock:
+            if self._jobs_cache_is_fresh():
+                return self._jobs_cache[1]
+
+            response = await self._fetch_jobs()
+            if isinstance(response, JobListingResponse):
+                self._jobs_cache = (time.monotonic(), response)
+            return response
+
+    def _jobs_cache_is_fresh(self) -> bool:
+        return (
+            self._jobs_cache is not None
+            and time.monotonic() - self._jobs_cache[0] < self.jobs_cache_ttl
+        )
+
+    def _build(
+        self,
+        model: type[BaseModel],
+        response: Any,
+        construct: Callable[[Dict[str, Any]], BaseModel],
+    ) -> Any:
+        """Turn a HireStream response into ``model``.
+
+        The first response of each kind per process is validated, so schema
+        drift shows up in the logs; later ones are only constructed. Bodies
+        that don't have the expected shape are returned as they came.
+        """
+        if STRICT_VALIDATION:
+            return model.model_validate(response)
+        if model not in self._validated_models:
+            self._validated_models.add(model)
+            try:
+                return model.model_validate(response)
+            except ValidationError as e:
+                self.logger.warning(
+                    f"HireStream response does not match {model.__name__}: {e}"
+                )
+        try:
+            return construct(response)
+        except (AttributeError, KeyError, TypeError):
+            return response
+
+    async def _fetch_jobs(self) -> JobListingResponse:
+        """Fetch the list of all jobs from the API"""
         self.logger.info("Fetching list of all jobs")
         response = await self._api_call("GET", "jobs/published-jobs/")
         self.logger.info(f"Successfully retrieved {response.get('count', 0)} jobs")
-        return response
+        if "text" in response:
+            return response
+        return self._build(JobListingResponse, response, _construct_job_listing)
 
     async def show_job_details(
         self, job_details_request: JobDetailsRequest
@@ -319,14 +505,18 @@ class HireStreamAPIClient:
         self.logger.info(
             f"Fetching details for job with UUID: {job_details_request.job_uuid}"
         )
-        response = await self._api_call(
-            "GET",
-            f"jobs/{job_details_request.job_uuid}/view-job/?timezone=Asia%2FKarachi",
+        endpoint = (
+            f"jobs/{job_details_request.job_uuid}/view-job/?timezone=Asia%2FKarachi"
+        )
+        response = await self._singleflight(
+            endpoint, lambda: self._api_call("GET", endpoint)
         )
         self.logger.info(
             f"Successfully retrieved details for job: {job_details_request.job_uuid}"
         )
-        return response
+        if "text" in response:
+            return response
+        return self._build(JobDetailsResponse, response, _construct_job_details)
 
     async def apply_to_job(self, job_apply_request: JobApplyRequest) -> Dict:
         """
@@ -334,8 +524,9 @@ class HireStreamAPIClient:
 
         First ask the user to upload the resume before calling this tool.
         """
-        payload = job_apply_request.model_dump()
-        self.logger.info(f"Applying to job: {payload}")
+        # Serialize straight to JSON bytes in pydantic-core (single pass)
+        payload = to_json(job_apply_request)
+        self.logger.info(f"Applying to job: {job_apply_request.job}")
         response = await self._api_call(
             "POST", "workflows/job-applications/?timezone=Asia%2FKarachi", payload
         )
@@ -353,59 +544,92 @@ class HireStreamAPIClient:
         The parsed resume data is used to apply to a job.
         Only call the apply_to_job tool after calling this tool.
         """
+        resume_file_url = resume_parse_request.resume_file_url
         try:
-            # Create a temporary directory for the file
-            with tempfile.TemporaryDirectory() as temp_dir:
-                output_path = os.path.join(temp_dir, "resume.pdf")
-
-                # Download the file from Google Drive
-                self.logger.info(
-                    f"Downloading resume from: {resume_parse_request.resume_file_url}"
-                )
-                gdown.download(
-                    resume_parse_request.resume_file_url,
-                    output_path,
-                    quiet=False,
-                    fuzzy=True,
-                    use_cookies=False,
+            # Download the file from Google Drive
+            self.logger.info(f"Downloading resume from: {resume_file_url}")
+            result = await self._stream_resume_from_drive(resume_file_url)
+            if result is None:
+                raise Exception(
+                    "Could not download the resume. Make sure the URL is a Google "
+                    "Drive file link and the file is shared publicly."
                 )
 
-                # Upload the file to the API
-                url = f"{self.base_api_url}/workflows/upload/?timezone=Asia%2FKarachi"
+            self.logger.info("Successfully parsed resume")
+            return result
 
-                async with httpx.AsyncClient(timeout=30) as client:
-                    # Read file as bytes
-                    with open(output_path, "rb") as file:
-                        file_bytes = file.read()
+        except Exception as e:
+            self.logger.exception("Resume parsing failed")
+            return {"error": str(e)}
 
-                    # Send both file and type in the form data
-                    files = {"file": ("resume.pdf", file_bytes, "application/pdf")}
-                    data = {"type": "cv"}
+    async def _upload_resume(self, **request_kwargs) -> Dict:
+        """Upload a resume to the API for parsing and return the parsed data"""
+        self.logger.info("Uploading resume to API for parsing")
+        response = await self._client.post(
+            "workflows/upload/?timezone=Asia%2FKarachi",
+            timeout=self.upload_timeout,
+            **request_kwargs,
+        )
 
-                    self.logger.info("Uploading resume to API for parsing")
-                    response = await client.post(url, files=files, data=data)
+        if response.status_code >= 400:
+            raise Exception(f"API Error {response.status_code}: {response.text}")
 
-                    if response.status_code >= 400:
-                        raise Exception(
-                            f"API Error {response.status_code}: {response.text}"
-                        )
+        return orjson.loads(response.content)
 
-                    result = response.json()
-                    self.logger.info("Successfully parsed resume")
-                    return result
+    async def _stream_resume_from_drive(self, resume_file_url: str) -> Optional[Dict]:
+        """
+        Pipe a publicly shared Google Drive file straight into the upload request.
 
-        except Exception as e:
-            self.logger.error(f"Resume parsing failed: {str(e)}")
-            traceback.print_exc()
-            return {"error": str(e)}
+        The download is streamed chunk by chunk into a hand-built multipart body,
+        so the resume is never held in memory or written to disk. Returns None if
+        the URL isn't a Drive file link or the file isn't publicly shared.
+        """
+        match = _DRIVE_ID_RE.search(resume_file_url)
+        if not match:
+            return None
+        file_id = match.group(1) or match.group(2)
+        download_url = (
+            f"https://drive.google.com/uc?export=download&id={file_id}&confirm=t"
+        )
 
+        async with self._client.stream(
+            "GET", download_url, follow_redirects=True, timeout=self.upload_timeout
+        ) as download:
+            # Drive answers with an HTML page when the file isn't public
+            content_type = download.headers.get("Content-Type", "")
+            if download.status_code >= 400 or content_type.startswith("text/html"):
+                return None
+
+            boundary = os.urandom(16).hex()
+            head = (
+                f"--{boundary}\r\n"
+                'Content-Disposition: form-data; name="type"\r\n\r\n'
+                "cv\r\n"
+                f"--{boundary}\r\n"
+                'Content-Disposition: form-data; name="file"; filename="resume.pdf"\r\n'
+                "Content-Type: application/pdf\r\n\r\n"
+            ).encode()
+            tail = f"\r\n--{boundary}--\r\n".encode()
+
+            async def body():
+                yield head
+                async for chunk in download.aiter_bytes():
+                    yield chunk
+                yield tail
+
+            headers = {"Content-Type": f"multipart/form-data; boundary={boundary}"}
+            # Send a Content-Length when Drive gives us one, otherwise go chunked
+            if "Content-Length" in download.headers and (
+                "Content-Encoding" not in download.headers
+            ):
+                headers["Content-Length"] = str(
+                    len(head) + int(download.headers["Content-Length"]) + len(tail)
+                )
 
-# server.py
-import os
-from typing import Dict
+            return await self._upload_resume(content=body(), headers=headers)
 
 
-import datetime
+# server.py
 from fastmcp import FastMCP
 from .mcp_adapter import build_app
 
@@ -419,16 +643,24 @@ hirestream_client = HireStreamAPIClient(
 )
 
 
+logger = logging.getLogger(__name__)
+
+
+async def _run(coro: Awaitable[Any]) -> Any:
+    """Await a tool's client call, turning failures into an error payload"""
+    try:
+        return await coro
+    except Exception as e:
+        logger.exception("Tool call failed")
+        return {"error": str(e), "type": e.__class__.__name__}
+
+
 @mcp.tool()
 async def list_jobs() -> JobListingResponse:
     """
     List all jobs in the Cogent labs.
     """
-    try:
-        result: JobListingResponse = await hirestream_client.list_jobs()
-        return result
-    except Exception as e:
-        return [{"error": str(e)}]
+    return await _run(hirestream_client.list_jobs())
 
 
 @mcp.tool()
@@ -440,13 +672,7 @@ async def show_job_details(
 
     Expects a JobDetailsRequest, returns a JobDetailsResponse.
     """
-    try:
-        result: JobDetailsResponse = await hirestream_client.show_job_details(
-            job_details_request
-        )
-        return result
-    except Exception as e:
-        return [{"error": str(e)}]
+    return await _run(hirestream_client.show_job_details(job_details_request))
 
 
 @mcp.tool()
@@ -454,10 +680,7 @@ async def parse_resume(resume_parse_request: ResumeParseRequest) -> Dict:
     """
     Parse the resume file from the google drive URL.
     """
-    try:
-        return await hirestream_client.parse_resume(resume_parse_request)
-    except Exception as e:
-        return [{"error": str(e)}]
+    return await _run(hirestream_client.parse_resume(resume_parse_request))
 
 
 @mcp.tool()
@@ -467,17 +690,12 @@ async def apply_to_job(job_apply_request: JobApplyRequest) -> Dict:
 
     First ask the user to upload the resume before he applies to the job.
     """
-    try:
-        result: JobDetailsResponse = await hirestream_client.apply_to_job(
-            job_apply_request
-        )
-        return result
-    except Exception as e:
-        return [{"error": str(e)}]
+    return await _run(hirestream_client.apply_to_job(job_apply_request))
 
 
 # Build the FastAPI app using the adapter
 app = build_app(mcp)
+app.add_event_handler("shutdown", hirestream_client.aclose)
 
 # For local development
 if __name__ == "__main__":
@@ -10,6 +10,12 @@ import platform
 import sys
 from pathlib import Path
 
+# orjson is optional, this script usually runs in a bare `uv run` environment
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # INJECTED_SERVER_URL = None
 
 
@@ -71,8 +77,9 @@ def load_or_create_config(config_path):
     """Load existing config or create a new one"""
     if config_path.exists():
         try:
-            with open(config_path, "r") as f:
-                return json.load(f)
+            with open(config_path, "rb") as f:
+                content = f.read()
+            return orjson.loads(content) if orjson else json.loads(content)
         except (json.JSONDecodeError, IOError):
             print(f"Warning: Could not read {config_path}, creating new config")
 
@@ -83,8 +90,12 @@ def load_or_create_config(config_path):
 def save_config(config_path, config_data):
     """Save config to file, creating directories if needed"""
     config_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(config_path, "w") as f:
-        json.dump(config_data, f, indent=2)
+    if orjson:
+        with open(config_path, "wb") as f:
+            f.write(orjson.dumps(config_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(config_path, "w") as f:
+            json.dump(config_data, f, indent=2)
 
 
 def get_uv_command():
@@ -96,21 +107,15 @@ def get_uv_command():
         "uv",  # In PATH
     ]
 
-    for path in possible_paths:
-        if Path(path).exists() or path == "uv":
-            return path
-
-    return "uv"  # Fallback
-
-
-def install_to_config(config_path, server_url, bridge_url, server_name, api_key=None):
-    """Install MCP server configuration to a config file"""
-    config = load_or_create_config(config_path)
+    # "uv" (in PATH) is also the fallback, so stop there without a stat
+    return next(
+        (path for path in possible_paths if path == "uv" or Path(path).exists()),
+        "uv",
+    )
 
-    # Ensure mcpServers exists
-    if "mcpServers" not in config:
-        config["mcpServers"] = {}
 
+def build_server_config(server_url, bridge_url, api_key=None):
+    """Build the MCP server entry shared by every client config"""
     # Use consistent argument format for both clients
     # The extra quotes were causing issues with argument parsing
     mcp_version_arg = "mcp>=1.0.0"
@@ -125,6 +130,17 @@ def install_to_config(config_path, server_url, bridge_url, server_name, api_key=
     if api_key:
         server_config["env"] = {"MCP_API_KEY": api_key}
 
+    return server_config
+
+
+def install_to_config(config_path, server_name, server_config):
+    """Install MCP server configuration to a config file"""
+    config = load_or_create_config(config_path)
+
+    # Ensure mcpServers exists
+    if "mcpServers" not in config:
+        config["mcpServers"] = {}
+
     # Add our server configuration
     config["mcpServers"][server_name] = server_config
 
@@ -186,9 +202,12 @@ def main():
     claude_config, cursor_config = get_config_paths()
     installed_to = []
 
+    # Same server entry for every client, so build it once
+    server_config = build_server_config(server_url, bridge_url, api_key)
+
     # Install to Claude Desktop
     try:
-        install_to_config(claude_config, server_url, bridge_url, server_name, api_key)
+        install_to_config(claude_config, server_name, server_config)
         print(f"✓ Installed to Claude Desktop: {claude_config}")
         installed_to.append("Claude Desktop")
     except Exception as e:
@@ -197,9 +216,7 @@ def main():
     # Install to Cursor (if config directory exists)
     if cursor_config.parent.exists():
         try:
-            install_to_config(
-                cursor_config, server_url, bridge_url, server_name, api_key
-            )
+            install_to_config(cursor_config, server_name, server_config)
             print(f"✓ Installed to Cursor: {cursor_config}")
             installed_to.append("Cursor")
         except Exception as e:
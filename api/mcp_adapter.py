@@ -3,21 +3,113 @@
 MCP Adapter for Vercel - Converts FastMCP to FastAPI with stateless HTTP handling.
 """
 
-import json
+import asyncio
+import datetime
+import hashlib
+import hmac
 import os
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse, PlainTextResponse
-from fastmcp import FastMCP, Client
+from fastapi.responses import ORJSONResponse, PlainTextResponse, Response
+from fastmcp import FastMCP
+import orjson
 from pathlib import Path
+import anyio.to_thread
+
+# Read once at import; Vercel fixes the environment for the function's lifetime
+REQUIRED_API_KEY = os.environ.get("MCP_API_KEY")
+
+# Worker threads available to run_sync/to_thread work; anyio defaults to 40
+THREAD_LIMIT = 200
+
+# Largest /mcp request body accepted, in bytes
+MAX_BODY_SIZE = 1 << 20
+
+# Served scripts only change on deploy; clients revalidate with If-None-Match
+SCRIPT_CACHE_CONTROL = "public, max-age=3600, must-revalidate"
+
+# Constant part of the /health body; only the timestamp changes per request
+HEALTH_PREFIX = b'{"status":"healthy","timestamp":'
+
+# Error replies that never carry a request id, serialized once
+PARSE_ERROR = orjson.dumps(
+    {"jsonrpc": "2.0", "id": None, "error": {"code": -32700, "message": "Parse error"}}
+)
+INVALID_REQUEST = orjson.dumps(
+    {
+        "jsonrpc": "2.0",
+        "id": None,
+        "error": {"code": -32600, "message": "Invalid Request"},
+    }
+)
+REQUEST_TOO_LARGE = orjson.dumps(
+    {
+        "jsonrpc": "2.0",
+        "id": None,
+        "error": {"code": -32600, "message": "Request too large"},
+    }
+)
+
+
+def json_response(content: Any, status_code: int = 200) -> Response:
+    """Serialize a JSON-RPC reply with orjson instead of JSONResponse's json.dumps"""
+    return ORJSONResponse(content, status_code=status_code)
+
+
+def raw_json_response(content: bytes, status_code: int) -> Response:
+    """Send one of the pre-serialized error replies above"""
+    return Response(
+        content=content, status_code=status_code, media_type="application/json"
+    )
+
+
+def make_etag(*parts: str) -> str:
+    """Strong ETag over the given strings"""
+    digest = hashlib.blake2b("\0".join(parts).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the client's If-None-Match already names this ETag"""
+    if_none_match = request.headers.get("If-None-Match")
+    if not if_none_match:
+        return False
+    # If-None-Match uses weak comparison, so W/"x" matches "x" (RFC 9110 13.1.2)
+    return any(
+        tag.strip().removeprefix("W/") in (etag, "*")
+        for tag in if_none_match.split(",")
+    )
+
+
+def read_script(path: Path) -> Optional[str]:
+    """Read a script served by the app, or None if it isn't deployed"""
+    try:
+        return path.read_text()
+    except OSError:
+        return None
+
+
+async def read_body(request: Request, max_size: int) -> Optional[bytes]:
+    """Read the request body, or return None once it exceeds max_size bytes"""
+    content_length = request.headers.get("Content-Length")
+    if content_length and content_length.isdigit() and int(content_length) > max_size:
+        return None
+
+    chunks = []
+    total = 0
+    async for chunk in request.stream():
+        total += len(chunk)
+        if total > max_size:
+            return None
+        chunks.append(chunk)
+    return b"".join(chunks)
 
 
 def check_api_key(request: Request) -> bool:
     """Check if the request has a valid API key when authentication is enabled"""
-    required_api_key = os.environ.get("MCP_API_KEY")
-
     # If no API key is set in environment, allow all requests
-    if not required_api_key:
+    if not REQUIRED_API_KEY:
         return True
 
     # Check for API key in headers
@@ -29,46 +121,69 @@ def check_api_key(request: Request) -> bool:
     if provided_key and provided_key.startswith("Bearer "):
         provided_key = provided_key[7:]  # Remove "Bearer " prefix
 
-    return provided_key == required_api_key
+    if not provided_key:
+        return False
+
+    # Constant-time compare so the key can't be guessed from response timing
+    return hmac.compare_digest(provided_key.encode(), REQUIRED_API_KEY.encode())
 
 
 async def get_tools_from_mcp(mcp: FastMCP) -> List[Dict[str, Any]]:
-    """Extract tool information from FastMCP using public API"""
-    async with Client(mcp) as client:
-        mcp_tools = await client.list_tools()
-        return [
-            {
-                "name": tool.name,
-                "description": tool.description or "",
-                "inputSchema": tool.inputSchema,
-            }
-            for tool in mcp_tools
-        ]
+    """Extract tool information from FastMCP using public API.
+
+    FastMCP caches get_tools() itself and clears it when tools change.
+    """
+    tools = await mcp.get_tools()
+    return [
+        {
+            "name": key,
+            "description": tool.description or "",
+            "inputSchema": tool.parameters,
+        }
+        for key, tool in tools.items()
+    ]
+
+
+def to_text_content(item: Any) -> Dict[str, str]:
+    """Convert an MCP content item to a text content dict"""
+    # EAFP: almost every item is TextContent, so skip the hasattr() probe
+    try:
+        return {"type": "text", "text": item.text}
+    except AttributeError:
+        return {"type": "text", "text": str(item)}
 
 
 async def call_mcp_tool(
     mcp: FastMCP, tool_name: str, arguments: Dict[str, Any]
 ) -> Dict[str, Any]:
-    """Call a tool using FastMCP's public API"""
+    """Call a tool on the FastMCP server directly.
+
+    FastMCP has no public call API, so this uses the handler its MCP server
+    registers for tools/call. That skips the in-process Client's JSON-RPC
+    round trip while keeping the request Context and mounted-server routing.
+    FastMCP 2.10 changed what the handler returns, so fastmcp is pinned below it.
+    """
     try:
-        async with Client(mcp) as client:
-            result = await client.call_tool(tool_name, arguments)
+        result = await mcp._mcp_call_tool(tool_name, arguments)
 
-            content = [
-                (
-                    {"type": "text", "text": item.text}
-                    if hasattr(item, "text")
-                    else {"type": "text", "text": str(item)}
-                )
-                for item in result
-            ]
+        content = [to_text_content(item) for item in result]
 
-            return {"content": content, "isError": False}
+        return {"content": content, "isError": False}
 
     except Exception as e:
         return {"error": {"code": -32603, "message": str(e)}}
 
 
+@lru_cache(maxsize=None)
+def initialize_result(server_name: str) -> Dict[str, Any]:
+    """Build the initialize result once per server; only the request id varies"""
+    return {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {"tools": {"listChanged": True}},
+        "serverInfo": {"name": server_name, "version": "1.0.0"},
+    }
+
+
 async def handle_mcp_method(
     mcp: FastMCP, method: str, params: Dict[str, Any], request_id: Any
 ) -> Dict[str, Any]:
@@ -78,11 +193,7 @@ async def handle_mcp_method(
         return {
             "jsonrpc": "2.0",
             "id": request_id,
-            "result": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {"tools": {"listChanged": True}},
-                "serverInfo": {"name": mcp.name, "version": "1.0.0"},
-            },
+            "result": initialize_result(mcp.name),
         }
 
     elif method == "tools/list":
@@ -118,85 +229,156 @@ async def handle_mcp_method(
         }
 
 
+async def handle_mcp_batch(mcp: FastMCP, batch: List[Any]) -> Response:
+    """Handle a JSON-RPC batch, running its calls concurrently"""
+    if not batch:
+        return raw_json_response(INVALID_REQUEST, status_code=400)
+
+    async def handle_message(message: Any) -> Dict[str, Any]:
+        if not isinstance(message, dict):
+            return {
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {"code": -32600, "message": "Invalid Request"},
+            }
+        request_id = message.get("id")
+        try:
+            return await handle_mcp_method(
+                mcp, message.get("method"), message.get("params", {}), request_id
+            )
+        except Exception as e:
+            return {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "error": {"code": -32603, "message": f"Internal error: {str(e)}"},
+            }
+
+    results = await asyncio.gather(*(handle_message(message) for message in batch))
+
+    # Notifications (messages without an id) get no response
+    responses = [
+        result
+        for message, result in zip(batch, results)
+        if not (isinstance(message, dict) and "id" not in message)
+    ]
+    if not responses:
+        return Response(status_code=204)
+    return json_response(responses)
+
+
 def build_app(mcp: FastMCP) -> FastAPI:
     """Build a FastAPI app from a FastMCP server for Vercel deployment"""
 
-    app = FastAPI(title=f"{mcp.name} - Vercel Adapter")
+    app = FastAPI(
+        title=f"{mcp.name} - Vercel Adapter", default_response_class=ORJSONResponse
+    )
+
+    async def raise_thread_limit():
+        """Keep bursts of parallel tool calls from queueing on the thread pool"""
+        anyio.to_thread.current_default_thread_limiter().total_tokens = THREAD_LIMIT
+
+    app.add_event_handler("startup", raise_thread_limit)
 
     @app.get("/")
     async def read_root():
         """Root endpoint with FastMCP reflection info"""
         tools_data = await get_tools_from_mcp(mcp)
-        return {
-            "message": f"{mcp.name} is running",
-            "status": "ok",
-            "server_name": mcp.name,
-            "tools_count": len(tools_data),
-            "available_tools": [tool["name"] for tool in tools_data],
-        }
+        # Returned as a response so FastAPI skips jsonable_encoder
+        return ORJSONResponse(
+            {
+                "message": f"{mcp.name} is running",
+                "status": "ok",
+                "server_name": mcp.name,
+                "tools_count": len(tools_data),
+                "available_tools": [tool["name"] for tool in tools_data],
+            },
+            headers={
+                "Cache-Control": "private, max-age=30",
+                "Vary": "X-API-Key, Authorization",
+            },
+        )
 
     @app.get("/health")
     async def health_check():
         """Health check endpoint"""
-        import datetime
+        timestamp = orjson.dumps(datetime.datetime.now().isoformat())
+        return Response(
+            content=HEALTH_PREFIX + timestamp + b"}",
+            media_type="application/json",
+            # Probes must always reach the origin
+            headers={"Cache-Control": "no-store"},
+        )
+
+    # Read the served scripts once instead of hitting the disk on every GET
+    bridge_script = read_script(Path(__file__).parent.parent / "bridge.py")
+    install_script = read_script(Path(__file__).parent / "install.py")
+    bridge_etag = make_etag(bridge_script or "")
+    install_etag = make_etag(install_script or "")
+
+    # Split install.py around the placeholder once, so injecting the server URL
+    # is a concatenation rather than a search of the whole script
+    install_prefix, placeholder, install_suffix = (install_script or "").partition(
+        "# INJECTED_SERVER_URL = None"
+    )
 
-        return {"status": "healthy", "timestamp": datetime.datetime.now().isoformat()}
+    @lru_cache(maxsize=32)
+    def render_install_script(server_url: str) -> Tuple[str, str]:
+        """Return install.py with the server URL injected, and its ETag"""
+        if not placeholder:
+            return install_script, install_etag
+        # repr() gives a correctly quoted Python string literal
+        content = (
+            f"{install_prefix}INJECTED_SERVER_URL = {server_url!r}{install_suffix}"
+        )
+        # The served body depends on the injected URL as well as the template
+        return content, make_etag(install_etag, server_url)
 
     @app.get("/bridge.py")
-    async def serve_bridge_script():
+    async def serve_bridge_script(request: Request):
         """Serve the bridge.py script for direct execution with uv run"""
-        try:
-            # Read the bridge.py file from the project root
-            bridge_script_path = Path(__file__).parent.parent / "bridge.py"
-            if bridge_script_path.exists():
-                content = bridge_script_path.read_text()
-                return PlainTextResponse(
-                    content=content,
-                    media_type="text/plain",
-                    headers={"Content-Disposition": "attachment; filename=bridge.py"},
-                )
-            else:
-                return PlainTextResponse(
-                    content="# Bridge script not found", status_code=404
-                )
-        except Exception as e:
+        if bridge_script is None:
             return PlainTextResponse(
-                content=f"# Error loading bridge script: {e}", status_code=500
+                content="# Bridge script not found", status_code=404
             )
 
+        cache_headers = {"ETag": bridge_etag, "Cache-Control": SCRIPT_CACHE_CONTROL}
+        if etag_matches(request, bridge_etag):
+            return Response(status_code=304, headers=cache_headers)
+
+        return PlainTextResponse(
+            content=bridge_script,
+            media_type="text/plain",
+            headers={
+                "Content-Disposition": "attachment; filename=bridge.py",
+                **cache_headers,
+            },
+        )
+
     @app.get("/install.py")
     async def serve_install_script(request: Request):
         """Serve the install.py script with dynamically injected server URL"""
-        try:
-            # Get the server URL from the request
-            server_url = f"{request.url.scheme}://{request.url.netloc}"
-
-            # Read the install.py file from the api directory
-            install_script_path = Path(__file__).parent / "install.py"
-            if install_script_path.exists():
-                content = install_script_path.read_text()
-
-                # Inject the server URL into the script
-                # Replace a placeholder with the actual server URL
-                injected_content = content.replace(
-                    "# INJECTED_SERVER_URL = None",
-                    f"INJECTED_SERVER_URL = '{server_url}'",
-                )
-
-                return PlainTextResponse(
-                    content=injected_content,
-                    media_type="text/plain",
-                    headers={"Content-Disposition": "attachment; filename=install.py"},
-                )
-            else:
-                return PlainTextResponse(
-                    content="# Install script not found", status_code=404
-                )
-        except Exception as e:
+        if install_script is None:
             return PlainTextResponse(
-                content=f"# Error loading install script: {e}", status_code=500
+                content="# Install script not found", status_code=404
             )
 
+        # Get the server URL from the request
+        server_url = f"{request.url.scheme}://{request.url.netloc}"
+
+        injected_content, etag = render_install_script(server_url)
+        cache_headers = {"ETag": etag, "Cache-Control": SCRIPT_CACHE_CONTROL}
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers=cache_headers)
+
+        return PlainTextResponse(
+            content=injected_content,
+            media_type="text/plain",
+            headers={
+                "Content-Disposition": "attachment; filename=install.py",
+                **cache_headers,
+            },
+        )
+
     @app.post("/mcp")
     async def handle_mcp_request(request: Request):
         """Handle MCP JSON-RPC requests using FastMCP's public API"""
@@ -204,30 +386,35 @@ def build_app(mcp: FastMCP) -> FastAPI:
             if not check_api_key(request):
                 raise HTTPException(status_code=403, detail="API key is required")
 
-            body = await request.body()
-            request_data = json.loads(body.decode())
+            body = await read_body(request, MAX_BODY_SIZE)
+            if body is None:
+                return raw_json_response(REQUEST_TOO_LARGE, status_code=413)
+
+            request_data = orjson.loads(body)
+
+            if isinstance(request_data, list):
+                return await handle_mcp_batch(mcp, request_data)
 
             method = request_data.get("method")
             params = request_data.get("params", {})
             request_id = request_data.get("id")
 
             response = await handle_mcp_method(mcp, method, params, request_id)
-            return JSONResponse(content=response)
+            return json_response(response)
 
-        except json.JSONDecodeError:
-            error_response = {
-                "jsonrpc": "2.0",
-                "id": None,
-                "error": {"code": -32700, "message": "Parse error"},
-            }
-            return JSONResponse(content=error_response, status_code=400)
+        except orjson.JSONDecodeError:
+            return raw_json_response(PARSE_ERROR, status_code=400)
 
         except Exception as e:
             error_response = {
                 "jsonrpc": "2.0",
-                "id": request_data.get("id") if "request_data" in locals() else None,
+                "id": (
+                    request_data.get("id")
+                    if isinstance(locals().get("request_data"), dict)
+                    else None
+                ),
                 "error": {"code": -32603, "message": f"Internal error: {str(e)}"},
             }
-            return JSONResponse(content=error_response, status_code=500)
+            return json_response(error_response, status_code=500)
 
     return app
@@ -2,9 +2,12 @@
 
 import argparse
 import asyncio
+import importlib.util
+import itertools
+import json
 import os
 import sys
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 import httpx
 from mcp.server import Server
@@ -12,6 +15,16 @@ from mcp.server.models import InitializationOptions
 import mcp.server.stdio
 import mcp.types as types
 
+# orjson is optional, `uv run` only guarantees the mcp package
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    json_loads = json.loads
+
 
 def extract_server_name_from_url(url: str) -> str:
     """Extract a server name from the URL."""
@@ -48,45 +61,95 @@ def parse_arguments() -> argparse.Namespace:
 
 
 class RemoteMCPBridge:
+    # How long to wait for other requests to join a batch before sending it
+    BATCH_WINDOW = 0.002
+
     def __init__(self, endpoint: str):
         self.endpoint = endpoint
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = httpx.AsyncClient(
+            # HTTP/2 needs the optional h2 package, which `uv run` may not have
+            http2=importlib.util.find_spec("h2") is not None,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60.0),
+        )
         self.api_key = os.environ.get("MCP_API_KEY")
+        # Every request goes to the same URL with the same headers
+        self._url = f"{endpoint}/mcp"
+        self._headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json, text/event-stream",
+        }
+        if self.api_key:
+            self._headers["X-API-Key"] = self.api_key
+        self._request_ids = itertools.count(1)
+        self._pending: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
 
     async def forward_request(
         self, method: str, params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Forward MCP requests to the remote server."""
-        request_data = {"jsonrpc": "2.0", "method": method, "id": 1}
+        """Forward MCP requests to the remote server.
+
+        Requests made within BATCH_WINDOW of each other are sent together as
+        one JSON-RPC batch POST.
+        """
+        request_data = {
+            "jsonrpc": "2.0",
+            "method": method,
+            "id": next(self._request_ids),
+        }
         if params:
             request_data["params"] = params
 
-        # Prepare headers
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json, text/event-stream",
-        }
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((request_data, future))
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_pending())
+        return await future
 
-        # Add API key if available
-        if self.api_key:
-            headers["X-API-Key"] = self.api_key
+    async def _flush_pending(self) -> None:
+        """Send the queued requests and hand each caller its response."""
+        await asyncio.sleep(self.BATCH_WINDOW)
+        batch, self._pending = self._pending, []
+        self._flush_task = None
 
         try:
-            # Use the /mcp endpoint path
-            url = f"{self.endpoint}/mcp"
+            body = batch[0][0] if len(batch) == 1 else [req for req, _ in batch]
             response = await self.client.post(
-                url,
-                json=request_data,
-                headers=headers,
+                self._url, content=json_dumps(body), headers=self._headers
             )
             response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {
-                "jsonrpc": "2.0",
-                "error": {"code": -32603, "message": f"Bridge error: {str(e)}"},
-                "id": 1,
+            data = json_loads(response.content)
+            responses = {
+                item.get("id"): item
+                for item in (data if isinstance(data, list) else [data])
             }
+            for request_data, future in batch:
+                result = responses.get(request_data["id"]) or {
+                    "jsonrpc": "2.0",
+                    "error": {"code": -32603, "message": "Bridge error: no response"},
+                    "id": request_data["id"],
+                }
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            for request_data, future in batch:
+                if not future.done():
+                    future.set_result(
+                        {
+                            "jsonrpc": "2.0",
+                            "error": {
+                                "code": -32603,
+                                "message": f"Bridge error: {str(e)}",
+                            },
+                            "id": request_data["id"],
+                        }
+                    )
+        finally:
+            # Cancelled mid-request: don't leave the callers waiting forever
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
 
 
 async def main():
@@ -192,4 +255,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop is optional (and unavailable on Windows); use it when installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
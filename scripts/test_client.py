@@ -5,13 +5,52 @@ Usage: python scripts/test_client.py <server_url>
 Example: python scripts/test_client.py mcp-fass.vercel.app
 """
 
+import asyncio
 import sys
 import json
-import requests
+import httpx
 
 
-def test_mcp_server(server_url: str):
-    """Test the MCP server with proper initialization sequence."""
+async def send(
+    client: httpx.AsyncClient, method: str, url: str, payload: dict | None = None
+):
+    """Send one request, returning the response or the exception it raised."""
+    try:
+        return await client.request(method, url, json=payload)
+    except Exception as e:
+        return e
+
+
+def print_result(title: str, result, notification: bool = False):
+    """Print a test's outcome in the same format for every request."""
+    print(f"\n{title}")
+    if isinstance(result, Exception):
+        print(f"Error: {result}")
+        return
+
+    print(f"Status: {result.status_code}")
+    if notification:
+        print(f"Response length: {len(result.content)} bytes")
+        if result.content:
+            try:
+                print(f"Response: {json.dumps(result.json(), indent=2)}")
+            except ValueError:
+                print(f"Response text: {result.text}")
+        return
+
+    try:
+        print(f"Response: {json.dumps(result.json(), indent=2)}")
+    except ValueError as e:
+        print(f"Error: {e}")
+
+
+async def test_mcp_server(server_url: str, client: httpx.AsyncClient):
+    """Test the MCP server with proper initialization sequence.
+
+    Server info and initialize run first; the remaining requests do not
+    depend on each other, so they are sent concurrently over ``client``
+    and printed in submission order.
+    """
     # Ensure the URL has the correct protocol
     if not server_url.startswith(("http://", "https://")):
         base_url = f"https://{server_url}"
@@ -20,20 +59,15 @@ def test_mcp_server(server_url: str):
 
     # Remove trailing slash if present
     base_url = base_url.rstrip("/")
+    mcp_url = f"{base_url}/mcp"
 
     print(f"Testing MCP Server at: {base_url}")
 
     # Test 0: Check server info
-    print("\n0. Testing server info...")
-    try:
-        response = requests.get(f"{base_url}/")
-        print(f"Status: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
-    except Exception as e:
-        print(f"Error: {e}")
+    result = await send(client, "GET", f"{base_url}/")
+    print_result("0. Testing server info...", result)
 
     # Test 1: Initialize request
-    print("\n1. Testing initialize request...")
     initialize_request = {
         "jsonrpc": "2.0",
         "id": 1,
@@ -44,88 +78,63 @@ def test_mcp_server(server_url: str):
             "clientInfo": {"name": "TestClient", "version": "1.0.0"},
         },
     }
-
-    try:
-        response = requests.post(f"{base_url}/mcp", json=initialize_request)
-        print(f"Status: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
-    except Exception as e:
-        print(f"Error: {e}")
-
-    # Test 2: Initialized notification
-    print("\n2. Testing initialized notification...")
-    initialized_notification = {"jsonrpc": "2.0", "method": "notifications/initialized"}
-
-    try:
-        response = requests.post(f"{base_url}/mcp", json=initialized_notification)
-        print(f"Status: {response.status_code}")
-        print(f"Response length: {len(response.content)} bytes")
-        if response.content:
-            try:
-                print(f"Response: {json.dumps(response.json(), indent=2)}")
-            except ValueError:
-                print(f"Response text: {response.text}")
-    except Exception as e:
-        print(f"Error: {e}")
-
-    # Test 3: Tools list request
-    print("\n3. Testing tools/list request...")
-    tools_request = {"jsonrpc": "2.0", "id": 2, "method": "tools/list"}
-
-    try:
-        response = requests.post(f"{base_url}/mcp", json=tools_request)
-        print(f"Status: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
-    except Exception as e:
-        print(f"Error: {e}")
-
-    # Test 4: Tool call - echo
-    print("\n4. Testing tools/call request (echo)...")
-    tool_call_request = {
-        "jsonrpc": "2.0",
-        "id": 3,
-        "method": "tools/call",
-        "params": {"name": "echo", "arguments": {"message": "Hello from test client!"}},
-    }
-
-    try:
-        response = requests.post(f"{base_url}/mcp", json=tool_call_request)
-        print(f"Status: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
-    except Exception as e:
-        print(f"Error: {e}")
-
-    # Test 5: Tool call - get_time
-    print("\n5. Testing tools/call request (get_time)...")
-    tool_call_request = {
-        "jsonrpc": "2.0",
-        "id": 4,
-        "method": "tools/call",
-        "params": {"name": "get_time", "arguments": {}},
-    }
-
-    try:
-        response = requests.post(f"{base_url}/mcp", json=tool_call_request)
-        print(f"Status: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
-    except Exception as e:
-        print(f"Error: {e}")
-
-    # Test 6: Tool call - add_numbers
-    print("\n6. Testing tools/call request (add_numbers)...")
-    tool_call_request = {
-        "jsonrpc": "2.0",
-        "id": 5,
-        "method": "tools/call",
-        "params": {"name": "add_numbers", "arguments": {"a": 42, "b": 8}},
-    }
-
-    try:
-        response = requests.post(f"{base_url}/mcp", json=tool_call_request)
-        print(f"Status: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
-    except Exception as e:
-        print(f"Error: {e}")
+    result = await send(client, "POST", mcp_url, initialize_request)
+    print_result("1. Testing initialize request...", result)
+
+    tests = [
+        (
+            # Test 2: Initialized notification
+            "2. Testing initialized notification...",
+            {"jsonrpc": "2.0", "method": "notifications/initialized"},
+        ),
+        (
+            # Test 3: Tools list request
+            "3. Testing tools/list request...",
+            {"jsonrpc": "2.0", "id": 2, "method": "tools/list"},
+        ),
+        (
+            # Test 4: Tool call - echo
+            "4. Testing tools/call request (echo)...",
+            {
+                "jsonrpc": "2.0",
+                "id": 3,
+                "method": "tools/call",
+                "params": {
+                    "name": "echo",
+                    "arguments": {"message": "Hello from test client!"},
+                },
+            },
+        ),
+        (
+            # Test 5: Tool call - get_time
+            "5. Testing tools/call request (get_time)...",
+            {
+                "jsonrpc": "2.0",
+                "id": 4,
+                "method": "tools/call",
+                "params": {"name": "get_time", "arguments": {}},
+            },
+        ),
+        (
+            # Test 6: Tool call - add_numbers
+            "6. Testing tools/call request (add_numbers)...",
+            {
+                "jsonrpc": "2.0",
+                "id": 5,
+                "method": "tools/call",
+                "params": {"name": "add_numbers", "arguments": {"a": 42, "b": 8}},
+            },
+        ),
+    ]
+
+    async with asyncio.TaskGroup() as tg:
+        tasks = [
+            tg.create_task(send(client, "POST", mcp_url, payload))
+            for _, payload in tests
+        ]
+
+    for (title, payload), task in zip(tests, tasks):
+        print_result(title, task.result(), notification="id" not in payload)
 
 
 def main():
@@ -136,7 +145,13 @@ def main():
         return
 
     server_url = sys.argv[1]
-    test_mcp_server(server_url)
+    asyncio.run(run(server_url))
+
+
+async def run(server_url: str):
+    # One HTTP/2 connection carries all the concurrent requests
+    async with httpx.AsyncClient(http2=True, timeout=30.0) as client:
+        await test_mcp_server(server_url, client)
 
 
 if __name__ == "__main__":